@@ -21,6 +21,15 @@ CHAR_TX_UUID = "0000ae01-0000-1000-8000-00805f9b34fb"  # Write to printer
 CHAR_RX_UUID = "0000ae02-0000-1000-8000-00805f9b34fb"  # Notifications from printer
 
 PRINTER_WIDTH = 384  # pixels
+RASTER_ROW_BYTES = PRINTER_WIDTH // 8  # 1-bit packed row
+
+# _send_command moves ~2 KB/s (20 bytes per 10 ms), so cap jobs at rows that
+# finish well within PrinterClient's 60s timeout (~25 cm of paper)
+MAX_RASTER_ROWS = 2000
+
+
+class RasterTooLargeError(ValueError):
+    """Raised when a print job has more rows than can be sent in time"""
 
 
 class MXW01Printer:
@@ -129,12 +138,18 @@ class MXW01Printer:
 
     def _encode_image_data(self, image: Image.Image) -> bytes:
         """Encode image for MXW01 printer"""
+        # Check printed height before doing any pixel work
+        aspect_ratio = image.height / image.width
+        new_height = int(PRINTER_WIDTH * aspect_ratio)
+        if new_height > MAX_RASTER_ROWS:
+            raise RasterTooLargeError(
+                f"Image would print {new_height} rows, limit is {MAX_RASTER_ROWS}"
+            )
+
         # Convert to grayscale
         img = image.convert('L')
 
         # Resize to printer width while maintaining aspect ratio
-        aspect_ratio = img.height / img.width
-        new_height = int(PRINTER_WIDTH * aspect_ratio)
         img = img.resize((PRINTER_WIDTH, new_height), Image.Resampling.LANCZOS)
 
         # Apply dithering
@@ -175,18 +190,7 @@ class MXW01Printer:
         # Encode for printer
         image_data = self._encode_image_data(img)
 
-        # Send print commands
-        await self._send_command(b'\x10\xff\xfe\x01')  # Initialize
-        await asyncio.sleep(0.1)
-
-        # Send image data
-        await self._send_command(image_data)
-
-        # Feed paper
-        await self._send_command(b'\x1a\xff\xff')
-
-        logger.info("Image sent to printer")
-        return {"success": True}
+        return await self._print_raster_data(image_data)
 
     async def print_text(self, text: str, font_size: int = 24):
         """Print text by rendering to image first"""
@@ -230,6 +234,31 @@ class MXW01Printer:
         # Encode for printer
         image_data = self._encode_image_data(image)
 
+        return await self._print_raster_data(image_data)
+
+    async def print_raster(self, data: bytes):
+        """Print a pre-packed 1-bit raster, skipping the encode pipeline
+
+        Rows are PRINTER_WIDTH pixels packed MSB-first into RASTER_ROW_BYTES
+        bytes, with a set bit meaning white (the layout of PIL's
+        Image.tobytes() for mode '1').
+        """
+        if not data or len(data) % RASTER_ROW_BYTES:
+            raise ValueError(
+                f"Raster size must be a non-zero multiple of {RASTER_ROW_BYTES} bytes"
+            )
+
+        rows = len(data) // RASTER_ROW_BYTES
+        if rows > MAX_RASTER_ROWS:
+            raise RasterTooLargeError(
+                f"Raster has {rows} rows, limit is {MAX_RASTER_ROWS}"
+            )
+
+        logger.info(f"Printing raw raster ({rows} rows)...")
+        return await self._print_raster_data(data)
+
+    async def _print_raster_data(self, image_data: bytes):
+        """Send encoded raster data as a print job"""
         # Send print commands
         await self._send_command(b'\x10\xff\xfe\x01')  # Initialize
         await asyncio.sleep(0.1)
@@ -70,6 +70,14 @@ class PrinterClient:
         """Print image"""
         return self._run_async(self.printer.print_image(image_path))
 
+    def print_image_direct(self, image):
+        """Print PIL Image"""
+        return self._run_async(self.printer.print_image_direct(image))
+
+    def print_raster(self, data: bytes):
+        """Print pre-packed 1-bit raster"""
+        return self._run_async(self.printer.print_raster(data))
+
     def set_intensity(self, intensity: int):
         """Set print intensity"""
         return self.printer.set_intensity(intensity)
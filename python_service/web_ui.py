@@ -1,4 +1,8 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Request, render_template, request, jsonify
+from werkzeug.exceptions import RequestEntityTooLarge
+from PIL import Image, UnidentifiedImageError
+from bluetooth_printer import RasterTooLargeError
+import io
 import logging
 import os
 from datetime import datetime
@@ -7,10 +11,30 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # Hard cap on upload bodies
+MAX_UPLOAD_PIXELS = 16 * 1024 * 1024  # Decoded size cap; prints are 384px wide
+UPLOAD_FORMATS = ('PNG', 'JPEG', 'GIF', 'BMP', 'WEBP')
+
+
+class InMemoryRequest(Request):
+    """Request that keeps multipart file parts in memory instead of temp files"""
+
+    @property
+    def max_content_length(self):
+        """Cap body size on the upload route only"""
+        if self.endpoint == 'print_image_upload':
+            return MAX_UPLOAD_BYTES
+        return super().max_content_length
+
+    def _get_file_stream(self, total_content_length, content_type,
+                         filename=None, content_length=None):
+        return io.BytesIO()
+
 
 def create_app(bridge, config):
     """Create and configure Flask application"""
     app = Flask(__name__)
+    app.request_class = InMemoryRequest
     app.config['BRIDGE'] = bridge
     app.config['CONFIG'] = config
 
@@ -98,6 +122,59 @@ def create_app(bridge, config):
             logger.error(f"Error printing image: {e}")
             return jsonify({'error': str(e)}), 500
 
+    @app.route('/api/print/image/upload', methods=['POST'])
+    def print_image_upload():
+        """Print image sent as raw request body or multipart upload"""
+        try:
+            if request.mimetype == 'multipart/form-data':
+                upload = request.files.get('file')
+                if upload is None:
+                    return jsonify({'error': 'File field required'}), 400
+                stream = upload.stream
+            else:
+                stream = request.stream
+
+            upload_format = request.args.get('format', 'image')
+            if upload_format not in ('image', 'raw'):
+                return jsonify({'error': "Format must be 'image' or 'raw'"}), 400
+
+            bridge = app.config['BRIDGE']
+
+            # Pre-packed 1-bit raster skips decoding and dithering entirely
+            if upload_format == 'raw':
+                data = stream.read()
+                if not data:
+                    return jsonify({'error': 'Image data required'}), 400
+                result = bridge.print_raster(data)
+                return jsonify(result)
+
+            try:
+                image = Image.open(stream, formats=UPLOAD_FORMATS)
+                if image.width * image.height > MAX_UPLOAD_PIXELS:
+                    return jsonify({
+                        'error': f'Image exceeds {MAX_UPLOAD_PIXELS} pixels'
+                    }), 413
+                image.load()
+            except Image.DecompressionBombError:
+                return jsonify({
+                    'error': f'Image exceeds {MAX_UPLOAD_PIXELS} pixels'
+                }), 413
+            except (UnidentifiedImageError, OSError) as e:
+                logger.warning(f"Rejected uploaded image: {e}")
+                return jsonify({'error': 'Unsupported or corrupt image'}), 400
+
+            result = bridge.print_image_direct(image)
+            return jsonify(result)
+        except RequestEntityTooLarge:
+            return jsonify({'error': f'Upload exceeds {MAX_UPLOAD_BYTES} bytes'}), 413
+        except RasterTooLargeError as e:
+            return jsonify({'error': str(e)}), 413
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        except Exception as e:
+            logger.error(f"Error printing uploaded image: {e}")
+            return jsonify({'error': str(e)}), 500
+
     @app.route('/api/print/test', methods=['POST'])
     def print_test():
         """Print test page"""